@@ -3,6 +3,30 @@ Consent page - Participant information and consent form.
 """
 import streamlit as st
 import os
+from pathlib import Path
+
+# Static page text
+_INTRO_MD = """
+        **All information about this study is contained in the participant information document.**
+
+        Please download and read the document carefully before providing your consent below.
+        """
+
+_DECLARATION_MD = """
+
+                1. I have read and understood the participant information above
+                2. I consent to participate in this research study voluntarily
+                3. I consent to the processing of my data anonymously for research purposes
+                4. I consent to being contacted via email for potential follow-up questions
+                5. I am at least 18 years old
+                """
+
+
+@st.cache_data(show_spinner=False)
+def _load_pdf(path: str, mtime: float) -> bytes:
+    """Read the consent PDF once and share it across sessions (mtime invalidates the cache)."""
+    return Path(path).read_bytes()
+
 
 def show():
     """Display the consent screen."""
@@ -16,23 +40,16 @@ def show():
 
     # Download button for consent PDF
     if consent_pdf_path and os.path.exists(consent_pdf_path):
-        st.markdown("""
-        **All information about this study is contained in the participant information document.**
-
-        Please download and read the document carefully before providing your consent below.
-        """)
+        st.markdown(_INTRO_MD)
 
         st.markdown("")  # Spacing
 
-        # Read PDF file and create download button
-        with open(consent_pdf_path, "rb") as pdf_file:
-            pdf_bytes = pdf_file.read()
-
+        # Deferred download: the PDF is only loaded (from cache) when the button is clicked
         col1, col2, col3 = st.columns([1, 1, 1])
         with col2:
             st.download_button(
                 label="📄 View Consent Form Details",
-                data=pdf_bytes,
+                data=lambda p=consent_pdf_path: _load_pdf(p, os.path.getmtime(p)),
                 file_name="participant_information.pdf",
                 mime="application/pdf",
                 use_container_width=True,
@@ -54,14 +71,7 @@ def show():
         key="consent_checkbox"
     )
 
-    st.markdown("""
-
-                1. I have read and understood the participant information above
-                2. I consent to participate in this research study voluntarily
-                3. I consent to the processing of my data anonymously for research purposes
-                4. I consent to being contacted via email for potential follow-up questions
-                5. I am at least 18 years old
-                """)
+    st.markdown(_DECLARATION_MD)
     
     st.markdown("")
     st.markdown("")
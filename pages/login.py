@@ -4,10 +4,8 @@ Login page - Check if user has participated before.
 import streamlit as st
 from utils.data_persistence import user_exists
 
-def show():
-    """Display the login screen with welcome message."""
-    # Welcome message at the top
-    st.markdown("""
+# Static page text
+_WELCOME_MD = """
     ## Welcome!
 
     Thanks for your participation! 
@@ -30,7 +28,13 @@ def show():
     - You can take breaks between videos - your progress is saved
 
     ---
-    """)
+    """
+
+
+def show():
+    """Display the login screen with welcome message."""
+    # Welcome message at the top
+    st.markdown(_WELCOME_MD)
 
     st.markdown("")  # Spacing
 
@@ -47,63 +51,59 @@ def show():
 
     st.markdown("")  # Spacing
 
-    # If user selected "Yes", show user ID input
+    # If user selected "Yes", show user ID input inside a form so the
+    # (remote) user lookup only runs on submit, not on every keystroke
     if participated == "Yes, I have participated before":
-        st.markdown("### Please enter your User ID")
-
-        user_id_input = st.text_input(
-            "User ID:",
-            key="user_id_input",
-            placeholder="Enter your user ID (e.g., ABCD12 or giha3042)",
-            help="Your user ID was shown to you after completing the questionnaire"
-        ).strip()
-
-        # Check if user ID exists
-        if user_id_input:
-            if user_exists(user_id_input):
-                st.success(f"✓ User ID '{user_id_input}' found!")
-                st.session_state.user_id_valid = True
-                # Store the user ID as entered (preserve original case)
-                st.session_state.validated_user_id = user_id_input
-            else:
-                st.error("⚠️ User ID not found. Please check your ID or select 'No' if this is your first time.")
-                st.info("💡 If you cannot remember your user ID, please reach out to the study administration.")
-                st.session_state.user_id_valid = False
-        else:
-            st.session_state.user_id_valid = False
+        with st.form("login_form", border=False):
+            st.markdown("### Please enter your User ID")
 
-    # Navigation buttons
-    st.markdown("")
-    st.markdown("")
-    col1, col2, col3 = st.columns([1, 1, 1])
+            user_id_input = st.text_input(
+                "User ID:",
+                key="user_id_input",
+                placeholder="Enter your user ID (e.g., ABCD12 or giha3042)",
+                help="Your user ID was shown to you after completing the questionnaire"
+            ).strip()
 
-    with col2:
-        if st.button("Next ▶️", use_container_width=True, type="primary"):
+            # Navigation buttons
+            st.markdown("")
+            st.markdown("")
+            col1, col2, col3 = st.columns([1, 1, 1])
+
+            with col2:
+                submitted = st.form_submit_button("Next ▶️", use_container_width=True, type="primary")
+
+        if submitted:
             # Validation
-            if participated == "Yes, I have participated before":
-                if not user_id_input:
-                    st.error("Please enter your user ID")
-                    st.info("💡 If you cannot remember your user ID, please reach out to the study administration.")
-                    st.stop()
-                elif not st.session_state.get('user_id_valid', False):
-                    st.error("User ID not found. Please check your ID.")
-                    st.info("💡 If you cannot remember your user ID, please reach out to the study administration.")
-                    st.stop()
-                else:
-                    # Valid returning user - use the validated ID with original case
-                    st.session_state.user.user_id = st.session_state.get('validated_user_id', user_id_input)
+            if not user_id_input:
+                st.error("Please enter your user ID")
+                st.info("💡 If you cannot remember your user ID, please reach out to the study administration.")
+                st.stop()
+            elif not user_exists(user_id_input):
+                st.error("⚠️ User ID not found. Please check your ID or select 'No' if this is your first time.")
+                st.info("💡 If you cannot remember your user ID, please reach out to the study administration.")
+                st.stop()
+            else:
+                # Valid returning user - use the ID as entered (preserve original case)
+                st.session_state.user.user_id = user_id_input
 
-                    # Check if familiarization is enabled
-                    config = st.session_state.config
-                    enable_familiarization = config.get('settings', {}).get('enable_familiarization', True)
+                # Check if familiarization is enabled
+                config = st.session_state.config
+                enable_familiarization = config.get('settings', {}).get('enable_familiarization', True)
 
-                    if enable_familiarization:
-                        st.session_state.page = 'pre_familiarization'
-                    else:
-                        st.session_state.page = 'videoplayer'
+                if enable_familiarization:
+                    st.session_state.page = 'pre_familiarization'
+                else:
+                    st.session_state.page = 'videoplayer'
 
-                    st.rerun()
-            else:
+                st.rerun()
+    else:
+        # Navigation buttons
+        st.markdown("")
+        st.markdown("")
+        col1, col2, col3 = st.columns([1, 1, 1])
+
+        with col2:
+            if st.button("Next ▶️", use_container_width=True, type="primary"):
                 # New user - go to consent page
                 st.session_state.page = 'consent'
                 st.rerun()
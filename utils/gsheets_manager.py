@@ -11,7 +11,6 @@ from google.oauth2.service_account import Credentials
 
 # Global connection cache
 _gsheets_connection = None
-_gspread_client = None
 
 def get_gsheets_connection():
     """
@@ -33,47 +32,52 @@ def get_gsheets_connection():
     return _gsheets_connection
 
 
-def get_gspread_client():
+@st.cache_resource(show_spinner=False)
+def _build_gspread_client():
     """
-    Get or create a cached gspread client directly from secrets.
-    This is used for advanced operations like append_row.
+    Build the gspread client from secrets (once per process).
 
-    Returns:
-        gspread.Client object or None if connection fails
+    Raises on failure so that nothing is cached and the next call retries.
     """
-    global _gspread_client
+    # Get credentials from secrets
+    credentials_dict = dict(st.secrets["connections"]["gsheets"])
 
-    if _gspread_client is None:
-        try:
-            # Get credentials from secrets
-            credentials_dict = dict(st.secrets["connections"]["gsheets"])
+    # Remove non-credential fields
+    credentials_dict.pop("spreadsheet", None)
 
-            # Remove non-credential fields
-            credentials_dict.pop("spreadsheet", None)
+    # Define the required scopes
+    scopes = [
+        "https://www.googleapis.com/auth/spreadsheets",
+        "https://www.googleapis.com/auth/drive"
+    ]
 
-            # Define the required scopes
-            scopes = [
-                "https://www.googleapis.com/auth/spreadsheets",
-                "https://www.googleapis.com/auth/drive"
-            ]
+    # Create credentials
+    credentials = Credentials.from_service_account_info(
+        credentials_dict,
+        scopes=scopes
+    )
 
-            # Create credentials
-            credentials = Credentials.from_service_account_info(
-                credentials_dict,
-                scopes=scopes
-            )
+    # Create gspread client
+    client = gspread.authorize(credentials)
+    print("[INFO] gspread client created successfully")
+    return client
 
-            # Create gspread client
-            _gspread_client = gspread.authorize(credentials)
-            print("[INFO] gspread client created successfully")
 
-        except Exception as e:
-            print(f"[ERROR] Failed to create gspread client: {e}")
-            import traceback
-            traceback.print_exc()
-            return None
+def get_gspread_client():
+    """
+    Get or create a cached gspread client directly from secrets.
+    This is used for advanced operations like append_row.
 
-    return _gspread_client
+    Returns:
+        gspread.Client object or None if connection fails
+    """
+    try:
+        return _build_gspread_client()
+    except Exception as e:
+        print(f"[ERROR] Failed to create gspread client: {e}")
+        import traceback
+        traceback.print_exc()
+        return None
 
 
 def append_rating_to_gsheets(rating_data, worksheet="v3_VideoText_ratings"):